@@ -1,4 +1,5 @@
 # backend_dev.py
+import json
 import sqlite3
 from typing import List, Tuple, Dict
 
@@ -94,12 +95,16 @@ def get_records() -> List[Tuple]:
     return results
 
 def update_record(record_id: int, pwe: int = None, pwe_with: int = None):
+    if pwe is None and pwe_with is None:
+        return
     conn = sqlite3.connect(DB_NAME)
     cursor = conn.cursor()
-    if pwe is not None:
-        cursor.execute("UPDATE ElectricityAccess SET people_without_electricity=? WHERE record_id=?", (pwe, record_id))
-    if pwe_with is not None:
-        cursor.execute("UPDATE ElectricityAccess SET people_with_electricity=? WHERE record_id=?", (pwe_with, record_id))
+    cursor.execute("""
+        UPDATE ElectricityAccess
+        SET people_without_electricity = COALESCE(?, people_without_electricity),
+            people_with_electricity = COALESCE(?, people_with_electricity)
+        WHERE record_id = ?
+    """, (pwe, pwe_with, record_id))
     conn.commit()
     conn.close()
 
@@ -147,18 +152,18 @@ def get_access_percentage_by_country(populations: Dict[str, int], target_year: i
     conn = sqlite3.connect(DB_NAME)
     cursor = conn.cursor()
     cursor.execute("""
-        SELECT c.country_name, e.people_without_electricity
+        WITH pop(country_name, population) AS (
+            SELECT key, value FROM json_each(?)
+        )
+        SELECT c.country_name,
+               (p.population - e.people_without_electricity) * 100.0 / p.population AS access_pct
         FROM ElectricityAccess e
         JOIN Countries c ON e.country_id = c.country_id
-        WHERE e.year = ?
-    """, (target_year,))
-    results = []
-    for country_name, pwe in cursor.fetchall():
-        total_pop = populations.get(country_name, None)
-        if total_pop:
-            access_pct = (total_pop - pwe) / total_pop * 100
-            results.append((country_name, access_pct))
-    results.sort(key=lambda x: x[1])
+        JOIN pop p ON p.country_name = c.country_name
+        WHERE e.year = ? AND p.population > 0
+        ORDER BY access_pct ASC
+    """, (json.dumps(populations), target_year))
+    results = cursor.fetchall()
     conn.close()
     return results
 
@@ -167,20 +172,19 @@ def get_regional_access_comparison(populations: Dict[str, int]) -> List[Tuple[st
     conn = sqlite3.connect(DB_NAME)
     cursor = conn.cursor()
     cursor.execute("""
-        SELECT c.region, c.country_name, e.people_without_electricity
+        WITH pop(country_name, population) AS (
+            SELECT key, value FROM json_each(?)
+        )
+        SELECT c.region,
+               AVG((p.population - e.people_without_electricity) * 100.0 / p.population) AS avg_pct
         FROM ElectricityAccess e
         JOIN Countries c ON e.country_id = c.country_id
-    """)
-    region_totals = {}
-    region_counts = {}
-    for region, country_name, pwe in cursor.fetchall():
-        total_pop = populations.get(country_name)
-        if total_pop:
-            access_pct = (total_pop - pwe) / total_pop * 100
-            region_totals[region] = region_totals.get(region, 0) + access_pct
-            region_counts[region] = region_counts.get(region, 0) + 1
-    results = [(region, region_totals[region]/region_counts[region]) for region in region_totals]
-    results.sort(key=lambda x: x[1], reverse=True)
+        JOIN pop p ON p.country_name = c.country_name
+        WHERE p.population > 0
+        GROUP BY c.region
+        ORDER BY avg_pct DESC
+    """, (json.dumps(populations),))
+    results = cursor.fetchall()
     conn.close()
     return results
 
@@ -189,17 +193,14 @@ def get_most_improved_countries() -> List[Tuple[str, int]]:
     conn = sqlite3.connect(DB_NAME)
     cursor = conn.cursor()
     cursor.execute("""
-        SELECT c.country_name, e.people_without_electricity
+        SELECT c.country_name,
+               MAX(e.people_without_electricity) - MIN(e.people_without_electricity) AS improvement
         FROM ElectricityAccess e
         JOIN Countries c ON e.country_id = c.country_id
+        GROUP BY c.country_name
+        ORDER BY improvement DESC
     """)
-    country_min = {}
-    country_max = {}
-    for country, pwe in cursor.fetchall():
-        country_min[country] = min(pwe, country_min.get(country, pwe))
-        country_max[country] = max(pwe, country_max.get(country, pwe))
-    results = [(country, country_max[country]-country_min[country]) for country in country_max]
-    results.sort(key=lambda x: x[1], reverse=True)
+    results = cursor.fetchall()
     conn.close()
     return results
 
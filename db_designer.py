@@ -1,18 +1,128 @@
 # db_designer.py
 # Simple and complete database designer code for Global Energy Access Analyzer
+import contextlib
+import functools
+import json
 import sqlite3
+import threading
 
 DB_NAME = "electricity_access.db"
+# Bump when init_db() gains new DDL so existing files get migrated
+SCHEMA_VERSION = 3
+
+# Statements used by more than one helper; sharing the same string
+# keeps them on one entry in the connection's statement cache
+_ADD_COUNTRY_HEAD = "INSERT OR IGNORE INTO Countries (country_name, region)"
+_ADD_RECORD_HEAD = ("INSERT INTO ElectricityAccess "
+                    "(country_id, year, people_without_electricity, people_with_electricity)")
+_SQL_ADD_COUNTRY = _ADD_COUNTRY_HEAD + " VALUES (?, ?)"
+_SQL_ADD_RECORD = _ADD_RECORD_HEAD + " VALUES (?, ?, ?, ?)"
+# Record listing, split so filtered variants keep the same columns and order
+_SELECT_RECORDS = """
+    SELECT e.record_id, c.country_name, e.year,
+           e.people_without_electricity, e.people_with_electricity
+    FROM ElectricityAccess e
+    JOIN Countries c ON e.country_id = c.country_id
+"""
+_ORDER_RECORDS = "    ORDER BY c.country_name, e.year\n"
+_SQL_GET_RECORDS = _SELECT_RECORDS + _ORDER_RECORDS
+_SQL_SEARCH_RECORDS = (_SELECT_RECORDS
+                       + "    WHERE c.country_name LIKE ? ESCAPE '\\'\n"
+                       + _ORDER_RECORDS)
+
+# Secondary indexes on ElectricityAccess, as (name, DDL)
+_EA_INDEXES = (
+    # Join/filter columns used by the analytical queries
+    ("idx_ea_country_year",
+     "CREATE INDEX IF NOT EXISTS idx_ea_country_year ON ElectricityAccess(country_id, year);"),
+    # Covers the per-year analytical queries without touching the table rows
+    ("idx_ea_year_pwe",
+     "CREATE INDEX IF NOT EXISTS idx_ea_year_pwe ON ElectricityAccess(year, country_id, people_without_electricity);"),
+    ("idx_ea_pwe",
+     "CREATE INDEX IF NOT EXISTS idx_ea_pwe ON ElectricityAccess(people_without_electricity DESC);"),
+)
+
+# One connection per thread, opened lazily and reused by every helper
+_local = threading.local()
+# Incremented by invalidate_cache() after every committed write
+_version = 0
+
+def get_conn():
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(DB_NAME, cached_statements=512)
+        # Per-connection settings, applied once when the connection opens
+        conn.execute("PRAGMA foreign_keys = ON;")
+        conn.execute("PRAGMA synchronous = NORMAL;")
+        conn.execute("PRAGMA temp_store = MEMORY;")
+        conn.execute("PRAGMA mmap_size = 268435456;")
+        conn.execute("PRAGMA cache_size = -65536;")
+        _local.conn = conn
+    return conn
+
+def close_conn():
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _local.conn = None
+        _local.cache = None
+
+def invalidate_cache():
+    # Writes committed on this thread's own connection don't change PRAGMA
+    # data_version, so callers writing through get_conn() directly must call this
+    global _version
+    _version += 1
+
+@contextlib.contextmanager
+def _writing():
+    # Transaction for a write helper; invalidates cached reads once committed
+    conn = get_conn()
+    with conn:
+        yield conn
+    invalidate_cache()
+
+def _cached(name, query):
+    # Per-thread copy of a read result, reused until this module writes or
+    # another connection commits (PRAGMA data_version changes)
+    conn = get_conn()
+    key = (_version, conn.execute("PRAGMA data_version;").fetchone()[0])
+    cache = getattr(_local, "cache", None)
+    if cache is None or getattr(_local, "cache_key", None) != key:
+        # Data changed: every cached result is stale, so start over
+        cache = _local.cache = {}
+        _local.cache_key = key
+    rows = cache.get(name)
+    if rows is None:
+        rows = cache[name] = query()
+    return list(rows)
+
+def _cached_query(fn):
+    # Serves repeat calls with the same arguments through _cached(). No sort_keys:
+    # it fails on dicts with mixed key types, and a reordered dict only costs a miss
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        key = (fn.__name__, json.dumps([args, kwargs]))
+        return _cached(key, lambda: fn(*args, **kwargs))
+    return wrapper
 
 # ----------------------------
 # 1. Create Database + Tables
 # ----------------------------
 def init_db():
-    conn = sqlite3.connect(DB_NAME)
+    conn = get_conn()
     cur = conn.cursor()
 
-    # Turn on foreign key support
-    cur.execute("PRAGMA foreign_keys = ON;")
+    # WAL is stored in the database file, so setting it here covers later connections
+    cur.execute("PRAGMA journal_mode = WAL;")
+
+    # Schema already at the latest version: only make sure the indexes exist,
+    # since a bulk_load() that died before its finally leaves them dropped
+    cur.execute("PRAGMA user_version;")
+    if cur.fetchone()[0] >= SCHEMA_VERSION:
+        for _, ddl in _EA_INDEXES:
+            cur.execute(ddl)
+        conn.commit()
+        return
 
     # Table: Countries
     cur.execute("""
@@ -35,74 +145,141 @@ def init_db():
         )
     """)
 
+    # Indexes: idx_ea_year was superseded by idx_ea_year_pwe in schema version 3
+    cur.execute("DROP INDEX IF EXISTS idx_ea_year;")
+    for _, ddl in _EA_INDEXES:
+        cur.execute(ddl)
+
+    cur.execute(f"PRAGMA user_version = {SCHEMA_VERSION};")
     conn.commit()
-    conn.close()
+
+@contextlib.contextmanager
+def bulk_load():
+    # Wrap a first-time load: an empty table is filled without its secondary
+    # indexes, which are then rebuilt in one pass instead of row by row
+    conn = get_conn()
+    empty = conn.execute("SELECT 1 FROM ElectricityAccess LIMIT 1;").fetchone() is None
+    if empty:
+        with conn:
+            for name, _ in _EA_INDEXES:
+                conn.execute(f"DROP INDEX IF EXISTS {name};")
+    try:
+        yield conn
+    except BaseException:
+        # Drop the caller's uncommitted rows; only the index rebuild below is committed
+        conn.rollback()
+        raise
+    finally:
+        with conn:
+            if empty:
+                for _, ddl in _EA_INDEXES:
+                    conn.execute(ddl)
+            # One statistics refresh for the whole load, not one per batch
+            conn.execute("ANALYZE;")
+        # The caller wrote on the yielded connection, outside _writing()
+        invalidate_cache()
 
 # ----------------------------
 # 2. CRUD Operations
 # ----------------------------
+def _insert_multi_row(conn, head, width, rows, rows_per_stmt=100):
+    # Packs rows_per_stmt rows into each "head VALUES (...), (...), ..." statement,
+    # cutting per-row bind/step overhead compared to executemany
+    placeholder = "(" + ", ".join(["?"] * width) + ")"
+    full_sql = head + " VALUES " + ", ".join([placeholder] * rows_per_stmt)
+    params = []
+    for row in rows:
+        # A short or long row would shift every later value into the wrong column
+        if len(row) != width:
+            raise ValueError(f"expected {width} values per row, got {len(row)}: {row!r}")
+        params.extend(row)
+        if len(params) == width * rows_per_stmt:
+            conn.execute(full_sql, params)
+            params = []
+    if params:
+        tail_rows = len(params) // width
+        conn.execute(head + " VALUES " + ", ".join([placeholder] * tail_rows), params)
+
 def add_country(country_name, region=None):
-    conn = sqlite3.connect(DB_NAME)
-    cur = conn.cursor()
-    cur.execute("INSERT OR IGNORE INTO Countries (country_name, region) VALUES (?, ?)", (country_name, region))
-    conn.commit()
-    conn.close()
+    # Returns the country_id, whether the row was inserted or already existed
+    find = "SELECT country_id FROM Countries WHERE country_name=? LIMIT 1"
+    with _writing() as conn:
+        # Look up first: files created by backend.py have no UNIQUE constraint on
+        # country_name, so INSERT OR IGNORE alone would add a duplicate there
+        row = conn.execute(find, (country_name,)).fetchone()
+        if row is None:
+            cur = conn.execute(_SQL_ADD_COUNTRY, (country_name, region))
+            if cur.rowcount:
+                return cur.lastrowid
+            # Ignored: another connection inserted the name since the lookup
+            row = conn.execute(find, (country_name,)).fetchone()
+        return row[0]
+
+def add_countries_bulk(countries):
+    # countries: iterable of (country_name, region); inserted in one transaction
+    with _writing() as conn:
+        _insert_multi_row(conn, _ADD_COUNTRY_HEAD, 2, countries)
 
 def get_countries():
-    conn = sqlite3.connect(DB_NAME)
-    cur = conn.cursor()
-    cur.execute("SELECT * FROM Countries")
-    rows = cur.fetchall()
-    conn.close()
-    return rows
+    return _cached("countries", lambda: get_conn().execute("SELECT * FROM Countries").fetchall())
 
 def add_record(country_id, year, pwe, pwe_with=None):
-    conn = sqlite3.connect(DB_NAME)
+    with _writing() as conn:
+        conn.execute(_SQL_ADD_RECORD, (country_id, year, pwe, pwe_with))
+
+def add_records_bulk(records):
+    # records: iterable of (country_id, year, pwe, pwe_with); inserted in one transaction.
+    # Large loads should run inside bulk_load(), which refreshes planner statistics once
+    with _writing() as conn:
+        _insert_multi_row(conn, _ADD_RECORD_HEAD, 4, records)
+
+def iter_records():
+    # Yields records lazily, fetching from SQLite in chunks of cur.arraysize
+    conn = get_conn()
     cur = conn.cursor()
-    cur.execute("""
-        INSERT INTO ElectricityAccess (country_id, year, people_without_electricity, people_with_electricity)
-        VALUES (?, ?, ?, ?)
-    """, (country_id, year, pwe, pwe_with))
-    conn.commit()
-    conn.close()
+    cur.arraysize = 1000
+    cur.execute(_SQL_GET_RECORDS)
+    while True:
+        rows = cur.fetchmany()
+        if not rows:
+            break
+        yield from rows
 
 def get_records():
-    conn = sqlite3.connect(DB_NAME)
+    return _cached("records", lambda: list(iter_records()))
+
+def search_records(term):
+    # Case-insensitive substring match on the country name, filtered inside SQLite
+    pattern = "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+    conn = get_conn()
     cur = conn.cursor()
-    cur.execute("""
-        SELECT e.record_id, c.country_name, e.year,
-               e.people_without_electricity, e.people_with_electricity
-        FROM ElectricityAccess e
-        JOIN Countries c ON e.country_id = c.country_id
-        ORDER BY c.country_name, e.year
-    """)
+    cur.execute(_SQL_SEARCH_RECORDS, (pattern,))
     rows = cur.fetchall()
-    conn.close()
     return rows
 
 def update_record(record_id, pwe=None, pwe_with=None):
-    conn = sqlite3.connect(DB_NAME)
-    cur = conn.cursor()
-    if pwe is not None:
-        cur.execute("UPDATE ElectricityAccess SET people_without_electricity=? WHERE record_id=?", (pwe, record_id))
-    if pwe_with is not None:
-        cur.execute("UPDATE ElectricityAccess SET people_with_electricity=? WHERE record_id=?", (pwe_with, record_id))
-    conn.commit()
-    conn.close()
+    if pwe is None and pwe_with is None:
+        return
+    with _writing() as conn:
+        # NULL parameters keep the current value, so one statement covers both fields
+        conn.execute("""
+            UPDATE ElectricityAccess
+            SET people_without_electricity = COALESCE(?, people_without_electricity),
+                people_with_electricity = COALESCE(?, people_with_electricity)
+            WHERE record_id = ?
+        """, (pwe, pwe_with, record_id))
 
 def delete_record(record_id):
-    conn = sqlite3.connect(DB_NAME)
-    cur = conn.cursor()
-    cur.execute("DELETE FROM ElectricityAccess WHERE record_id=?", (record_id,))
-    conn.commit()
-    conn.close()
+    with _writing() as conn:
+        conn.execute("DELETE FROM ElectricityAccess WHERE record_id=?", (record_id,))
 
 # ----------------------------
 # 3. Analytical Queries
 # ----------------------------
+@_cached_query
 def get_high_unserved_countries(threshold=1000000):
     """1. Countries with more than X people without electricity"""
-    conn = sqlite3.connect(DB_NAME)
+    conn = get_conn()
     cur = conn.cursor()
     cur.execute("""
         SELECT c.country_name, e.year, e.people_without_electricity
@@ -112,12 +289,12 @@ def get_high_unserved_countries(threshold=1000000):
         ORDER BY e.people_without_electricity DESC
     """, (threshold,))
     data = cur.fetchall()
-    conn.close()
     return data
 
+@_cached_query
 def get_yearly_access_trend():
     """2. Total people with electricity each year"""
-    conn = sqlite3.connect(DB_NAME)
+    conn = get_conn()
     cur = conn.cursor()
     cur.execute("""
         SELECT year, SUM(COALESCE(people_with_electricity, 0))
@@ -126,81 +303,75 @@ def get_yearly_access_trend():
         ORDER BY year ASC
     """)
     data = cur.fetchall()
-    conn.close()
     return data
 
+@_cached_query
 def get_access_percentage_by_country(populations, year):
     """3. Percent electricity access by country for a year (needs dict of populations)"""
-    conn = sqlite3.connect(DB_NAME)
+    conn = get_conn()
     cur = conn.cursor()
+    # Populations are bound as one JSON object so the join and arithmetic run in SQLite
     cur.execute("""
-        SELECT c.country_name, e.people_without_electricity
+        WITH pop(country_name, population) AS (
+            SELECT key, value FROM json_each(?)
+        )
+        SELECT c.country_name,
+               ROUND((p.population - e.people_without_electricity) * 100.0 / p.population, 2) AS pct
         FROM ElectricityAccess e
         JOIN Countries c ON e.country_id = c.country_id
-        WHERE e.year = ?
-    """, (year,))
-    results = []
-    for country, pwe in cur.fetchall():
-        if country in populations:
-            pop = populations[country]
-            access_pct = round((pop - pwe) / pop * 100, 2)
-            results.append((country, access_pct))
-    conn.close()
-    return sorted(results, key=lambda x: x[1])
+        JOIN pop p ON p.country_name = c.country_name
+        WHERE e.year = ? AND p.population > 0
+        ORDER BY pct ASC
+    """, (json.dumps(populations), year))
+    data = cur.fetchall()
+    return data
 
+@_cached_query
 def get_regional_access_comparison(populations, year):
     """4. Average access % by region"""
-    conn = sqlite3.connect(DB_NAME)
+    conn = get_conn()
     cur = conn.cursor()
     cur.execute("""
-        SELECT c.region, c.country_name, e.people_without_electricity
+        WITH pop(country_name, population) AS (
+            SELECT key, value FROM json_each(?)
+        )
+        SELECT c.region,
+               ROUND(AVG((p.population - e.people_without_electricity) * 100.0 / p.population), 2) AS avg_pct
         FROM ElectricityAccess e
         JOIN Countries c ON e.country_id = c.country_id
-        WHERE e.year = ?
-    """, (year,))
-    region_totals = {}
-    region_counts = {}
-    for region, country, pwe in cur.fetchall():
-        if country in populations:
-            pop = populations[country]
-            access_pct = (pop - pwe) / pop * 100
-            region_totals[region] = region_totals.get(region, 0) + access_pct
-            region_counts[region] = region_counts.get(region, 0) + 1
-    results = [(r, round(region_totals[r] / region_counts[r], 2)) for r in region_totals]
-    conn.close()
-    return sorted(results, key=lambda x: x[1], reverse=True)
+        JOIN pop p ON p.country_name = c.country_name
+        WHERE e.year = ? AND p.population > 0
+        GROUP BY c.region
+        ORDER BY avg_pct DESC
+    """, (json.dumps(populations), year))
+    data = cur.fetchall()
+    return data
 
+@_cached_query
 def get_most_improved_countries():
     """5. Countries that improved the most (drop in people without electricity)"""
-    conn = sqlite3.connect(DB_NAME)
+    conn = get_conn()
     cur = conn.cursor()
     cur.execute("""
-        SELECT c.country_name, e.year, e.people_without_electricity
+        SELECT c.country_name,
+               MAX(e.people_without_electricity) - MIN(e.people_without_electricity) AS improvement
         FROM ElectricityAccess e
         JOIN Countries c ON e.country_id = c.country_id
-        ORDER BY c.country_name, e.year
+        GROUP BY c.country_name
+        ORDER BY improvement DESC
     """)
     data = cur.fetchall()
-    changes = {}
-    for country, year, pwe in data:
-        if country not in changes:
-            changes[country] = [pwe, pwe]  # [min, max]
-        else:
-            changes[country][0] = min(changes[country][0], pwe)
-            changes[country][1] = max(changes[country][1], pwe)
-    improvements = [(c, old - new) for c, (new, old) in changes.items()]
-    conn.close()
-    return sorted(improvements, key=lambda x: x[1], reverse=True)
+    return data
 
 # ----------------------------
 # 4. Example Run (for testing)
 # ----------------------------
 if __name__ == "__main__":
     init_db()
-    add_country("Kenya", "Africa")
-    add_country("India", "Asia")
-    add_record(1, 2020, 5000000, 40000000)
-    add_record(2, 2020, 10000000, 900000000)
+    kenya_id = add_country("Kenya", "Africa")
+    india_id = add_country("India", "Asia")
+    add_record(kenya_id, 2020, 5000000, 40000000)
+    add_record(india_id, 2020, 10000000, 900000000)
 
     print("Countries:", get_countries())
     print("Records:", get_records())
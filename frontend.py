@@ -1,5 +1,7 @@
+import sys
+import tkinter as tk
 import customtkinter as ctk
-from PIL import Image
+from PIL import Image, ImageTk
 
 # set up window size, position
 window_width = 700
@@ -12,175 +14,206 @@ x = int((screen_width / 2) - (window_width / 2))
 y = int((screen_height / 2) - (window_height / 2))
 window.geometry(f'{window_width}x{window_height}+{x}+{y}')
 window.resizable(False, False)
-window.iconbitmap("icon.ico")
+# .ico files only work with iconbitmap on Windows, elsewhere go through a photo image
+try:
+    if sys.platform == "win32":
+        window.iconbitmap("icon.ico")
+    else:
+        icon_image = ImageTk.PhotoImage(Image.open("icon.ico"))
+        window.wm_iconphoto(True, icon_image)
+except (tk.TclError, OSError):
+    pass
 
 # background image
 bg_image = ctk.CTkImage(dark_image=Image.open("background.png"), size=(700, 400))
 bg_label = ctk.CTkLabel(window, image=bg_image, text="")
-bg_label.place(x=0, y=0, relwidth=1, relheight=1)
 bg_label.lower()
 ctk.set_appearance_mode("dark")
 window.configure(fg_color="#000000")
 
+# fonts, shared by every widget
+FONT_14 = ctk.CTkFont(family="Helvetica", size=14, weight="bold")
+FONT_16 = ctk.CTkFont(family="Helvetica", size=16, weight="bold")
+
+# button colours, shared by every button of the same colour
+GREEN_BTN = dict(fg_color="#588157", hover_color="#436644", cursor="hand2")
+BLUE_BTN = dict(fg_color="#0077b6", hover_color="#025b87", cursor="hand2")
+ORANGE_BTN = dict(fg_color="#fca311", hover_color="#c2a800", cursor="hand2")
+RED_BTN = dict(fg_color="#c1121f", hover_color="#960d17", cursor="hand2")
+GREY_BTN = dict(fg_color="#778da9", hover_color="#415a77", cursor="hand2")
+LIGHT_GREY_BTN = dict(fg_color="#adb5bd", hover_color="#6c757d", cursor="hand2")
+
+# entry contents, shared by every screen
+code_var = ctk.StringVar(master=window)
+name_var = ctk.StringVar(master=window)
+people_var = ctk.StringVar(master=window)
+year_var = ctk.StringVar(master=window)
+
+# widgets currently placed in the window
+_placed = set()
+
+def show(w, **kw):
+    w.place(**kw)
+    _placed.add(w)
+
+show(bg_label, x=0, y=0, relwidth=1, relheight=1)
+
 def hide_all_buttons():
     clear_screen(exceptions=[bg_label])
-    back_button.place(x=600, y=15)
+    show(back_button, x=600, y=15)
 
 # clear everything in the window except background
 def clear_screen(exceptions=()):
-    for w in window.winfo_children():
-        if w in exceptions:
-            continue
+    for w in _placed - set(exceptions):
         w.place_forget()
+    _placed.clear()
+    _placed.update(exceptions)
 
 # define button event
 
 def back_button_event():
     clear_screen(exceptions=[bg_label])
-    add_button.place(x=150, y=100)
-    edit_button.place(x=400, y=100)
-    delete_button.place(x=150, y=190)
-    view_button.place(x=400, y=190)
-    back_button.place_forget()
+    show(add_button, x=150, y=100)
+    show(edit_button, x=400, y=100)
+    show(delete_button, x=150, y=190)
+    show(view_button, x=400, y=190)
+
+# status label settings for a failed / successful submit
+_err_cfg = {"text": "Please fill all information", "text_color": "#e63946"}
+_ok_cfg = {"text": "Successful!", "text_color": "#6a994e"}
 
 def confirm_btn():
-    code = country_code.get()
-    name = country_name.get()
-    ppl = people.get()
-    yr = year.get()
-    if not (code and name and ppl and yr):
-        status_label.place(x=270, y=350)
-        status_label.configure(text="Please fill all information", text_color='#e63946')
+    vals = (code_var.get(), name_var.get(), people_var.get(), year_var.get())
+    if all(vals):
+        status_label.configure(**_ok_cfg)
+        show(status_label, x=320, y=350)
     else:
-        status_label.place(x=320, y=350)
-        status_label.configure(text="Successful!", text_color="#6a994e")
-
-def show_add_screen():
-    hide_all_buttons()
-    global country_code, country_name, year, people, status_label
-
-    country_c = ctk.CTkLabel(window, text="Country Code", font=("Helvetica", 14, "bold"))
-    country_c.place(x=215, y=80)
-    country_code = ctk.CTkEntry(window, width=60, fg_color= '#e5e5e5', text_color="#000000")
-    country_code.place(x=350, y=80)
-
-    country_n = ctk.CTkLabel(window, text="Country Name", font=("Helvetica", 14, "bold"))
-    country_n.place(x=215, y=120)
-    country_name = ctk.CTkEntry(window, width=180, fg_color= '#e5e5e5', text_color="#000000")
-    country_name.place(x=350, y=120)
-
-    n_people = ctk.CTkLabel(window, text="Number of People", font=("Helvetica", 14, "bold"))
-    n_people.place(x=215, y=160)
-    people = ctk.CTkEntry(window, width=120, fg_color= '#e5e5e5', text_color="#000000")
-    people.place(x=350, y=160)
+        status_label.configure(**_err_cfg)
+        show(status_label, x=270, y=350)
 
-    yr = ctk.CTkLabel(window, text="Year", font=("Helvetica", 14, "bold"))
-    yr.place(x=215, y=200)
-    year = ctk.CTkEntry(window, width=80, fg_color= '#e5e5e5', text_color="#000000")
-    year.place(x=350, y=200)
+# widgets of each screen, built on its first visit: name -> (layout, status label)
+_screens = {}
 
-    status_label = ctk.CTkLabel(window, text="", font=("Helvetica", 14, "bold"))
+def _show_screen(name, build):
+    global status_label
+    hide_all_buttons()
+    if name not in _screens:
+        _screens[name] = build()
+    # confirm_btn / delete_btn report through the status label of the screen on show
+    layout, status_label = _screens[name]
+    for var in (code_var, name_var, people_var, year_var):
+        var.set("")
+    for w, x, y in layout:
+        show(w, x=x, y=y)
+
+# add and edit share the same form, only the bottom button differs
+def _build_form(btn_text, btn_style, cmd):
+    country_c = ctk.CTkLabel(window, text="Country Code", font=FONT_14)
+    country_code = ctk.CTkEntry(window, textvariable=code_var, width=60, fg_color= '#e5e5e5', text_color="#000000")
+
+    country_n = ctk.CTkLabel(window, text="Country Name", font=FONT_14)
+    country_name = ctk.CTkEntry(window, textvariable=name_var, width=180, fg_color= '#e5e5e5', text_color="#000000")
+
+    n_people = ctk.CTkLabel(window, text="Number of People", font=FONT_14)
+    people = ctk.CTkEntry(window, textvariable=people_var, width=120, fg_color= '#e5e5e5', text_color="#000000")
+
+    yr = ctk.CTkLabel(window, text="Year", font=FONT_14)
+    year = ctk.CTkEntry(window, textvariable=year_var, width=80, fg_color= '#e5e5e5', text_color="#000000")
+
+    status_label = ctk.CTkLabel(window, text="", font=FONT_14)
     
-    add_confirm = ctk.CTkButton(window, text="ADD", font=("Helvetica", 14, "bold"), width=120, height=40, fg_color="#588157", hover_color="#436644", cursor="hand2", command=confirm_btn)
-    add_confirm.place(x=300, y=300)
+    form_btn = ctk.CTkButton(window, text=btn_text, font=FONT_14, width=120, height=40, **btn_style, command=cmd)
 
-def show_edit_screen():
-    hide_all_buttons()
-    global country_code, country_name, year, people, status_label
+    layout = [(country_c, 215, 80), (country_code, 350, 80),
+              (country_n, 215, 120), (country_name, 350, 120),
+              (n_people, 215, 160), (people, 350, 160),
+              (yr, 215, 200), (year, 350, 200),
+              (form_btn, 300, 300)]
+    return layout, status_label
 
-    country_c = ctk.CTkLabel(window, text="Country Code", font=("Helvetica", 14, "bold"))
-    country_c.place(x=215, y=80)
-    country_code = ctk.CTkEntry(window, width=60, fg_color= '#e5e5e5', text_color="#000000")
-    country_code.place(x=350, y=80)
+def build_add_screen():
+    return _build_form("ADD", GREEN_BTN, confirm_btn)
 
-    country_n = ctk.CTkLabel(window, text="Country Name", font=("Helvetica", 14, "bold"))
-    country_n.place(x=215, y=120)
-    country_name = ctk.CTkEntry(window, width=180, fg_color= '#e5e5e5', text_color="#000000")
-    country_name.place(x=350, y=120)
+def build_edit_screen():
+    return _build_form("SAVE", BLUE_BTN, confirm_btn)
 
-    n_ppl = ctk.CTkLabel(window, text="Number of People", font=("Helvetica", 14, "bold"))
-    n_ppl.place(x=215, y=160)
-    people = ctk.CTkEntry(window, width=120, fg_color= '#e5e5e5', text_color="#000000")
-    people.place(x=350, y=160)
+def build_view_screen():
+    country_c = ctk.CTkLabel(window, text="Country Code", font=FONT_14)
+    country_c2 = ctk.CTkEntry(window, textvariable=code_var, width=60, fg_color= '#e5e5e5', text_color="#000000")
 
-    yr = ctk.CTkLabel(window, text="Year", font=("Helvetica", 14, "bold"))
-    yr.place(x=215, y=200)
-    year = ctk.CTkEntry(window, width=80, fg_color= '#e5e5e5', text_color="#000000")
-    year.place(x=350, y=200)
+    label = ctk.CTkLabel(window, text="OR", font=FONT_14)
 
-    status_label = ctk.CTkLabel(window, text="", font=("Helvetica", 14, "bold"))
-    
-    save_btn = ctk.CTkButton(window, text="SAVE", font=("Helvetica", 14, "bold"), width=120, height=40, fg_color="#0077b6", hover_color="#025b87", cursor="hand2", command=confirm_btn)
-    save_btn.place(x=300, y=300)
+    country_n = ctk.CTkLabel(window, text="Country Name", font=FONT_14)
+    country_n2 = ctk.CTkEntry(window, textvariable=name_var, width=180, fg_color= '#e5e5e5', text_color="#000000")
 
-def show_view_screen():
-    hide_all_buttons()
-    global country_code, country_name, year, people, status_label
+    search_btn = ctk.CTkButton(window, text="SEARCH", font=FONT_14, width=120, height=40, **GREY_BTN)
 
-    country_c = ctk.CTkLabel(window, text="Country Code", font=("Helvetica", 14, "bold"))
-    country_c.place(x=215, y=120)
-    country_c2 = ctk.CTkEntry(window, width=60, fg_color= '#e5e5e5', text_color="#000000")
-    country_c2.place(x=320, y=120)
+    layout = [(country_c, 215, 120), (country_c2, 320, 120),
+              (label, 330, 160),
+              (country_n, 215, 200), (country_n2, 320, 200),
+              (search_btn, 300, 300)]
+    return layout, None
 
-    label = ctk.CTkLabel(window, text="OR", font=("Helvetica", 14, "bold"))
-    label.place(x=330, y=160)
+def build_delete_screen():
+    country_c = ctk.CTkLabel(window, text="Country Code", font=FONT_14)
+    country_code = ctk.CTkEntry(window, textvariable=code_var, width=60, fg_color= '#e5e5e5', text_color="#000000")
 
-    country_n = ctk.CTkLabel(window, text="Country Name", font=("Helvetica", 14, "bold"))
-    country_n.place(x=215, y=200)
-    country_n2 = ctk.CTkEntry(window, width=180, fg_color= '#e5e5e5', text_color="#000000")
-    country_n2.place(x=320, y=200)
+    country_n = ctk.CTkLabel(window, text="Country Name", font=FONT_14)
+    country_name = ctk.CTkEntry(window, textvariable=name_var, width=180, fg_color= '#e5e5e5', text_color="#000000")
 
-    search_btn = ctk.CTkButton(window, text="SEARCH", font=("Helvetica", 14, "bold"), width=120, height=40, fg_color="#778da9", hover_color="#415a77", cursor="hand2")
-    search_btn.place(x=300, y=300)
+    yr = ctk.CTkLabel(window, text="Year", font=FONT_14)
+    year = ctk.CTkEntry(window, textvariable=year_var, width=80, fg_color= '#e5e5e5', text_color="#000000")
 
-def show_delete_screen():
-    global country_code, country_name, year, status_label
-    hide_all_buttons()
+    status_label = ctk.CTkLabel(window, text="", font=FONT_14)
 
-    country_c = ctk.CTkLabel(window, text="Country Code", font=("Helvetica", 14, "bold"))
-    country_c.place(x=235, y=120)
-    country_code = ctk.CTkEntry(window, width=60, fg_color= '#e5e5e5', text_color="#000000")
-    country_code.place(x=350, y=120)
+    del_btn = ctk.CTkButton(window, text="DELETE", font=FONT_14, width=120, height=40, **RED_BTN, command=delete_btn)
 
-    country_n = ctk.CTkLabel(window, text="Country Name", font=("Helvetica", 14, "bold"))
-    country_n.place(x=235, y=160)
-    country_name = ctk.CTkEntry(window, width=180, fg_color= '#e5e5e5', text_color="#000000")
-    country_name.place(x=350, y=160)
+    layout = [(country_c, 235, 120), (country_code, 350, 120),
+              (country_n, 235, 160), (country_name, 350, 160),
+              (yr, 235, 200), (year, 350, 200),
+              (del_btn, 300, 300)]
+    return layout, status_label
 
-    yr = ctk.CTkLabel(window, text="Year", font=("Helvetica", 14, "bold"))
-    yr.place(x=235, y=200)
-    year = ctk.CTkEntry(window, width=80, fg_color= '#e5e5e5', text_color="#000000")
-    year.place(x=350, y=200)
+def show_add_screen():
+    _show_screen("add", build_add_screen)
 
-    status_label = ctk.CTkLabel(window, text="", font=("Helvetica", 14, "bold"))
+def show_edit_screen():
+    _show_screen("edit", build_edit_screen)
 
-    del_btn = ctk.CTkButton(window, text="DELETE", font=("Helvetica", 14, "bold"), width=120, height=40, fg_color="#c1121f", hover_color="#960d17", cursor="hand2", command=delete_btn)
-    del_btn.place(x=300, y=300)
+def show_view_screen():
+    _show_screen("view", build_view_screen)
+
+def show_delete_screen():
+    _show_screen("delete", build_delete_screen)
 
 def delete_btn():
-    code = country_code.get()
-    name = country_name.get()
-    yr = year.get()
-    if not (code and name and yr):
-        status_label.place(x=270, y=350)
-        status_label.configure(text="Please fill all information", text_color='#e63946')
+    vals = (code_var.get(), name_var.get(), year_var.get())
+    if all(vals):
+        status_label.configure(**_ok_cfg)
+        show(status_label, x=320, y=350)
     else:
-        status_label.place(x=320, y=350)
-        status_label.configure(text="Successful!", text_color="#6a994e")
+        status_label.configure(**_err_cfg)
+        show(status_label, x=270, y=350)
 
 # define buttons
-add_button = ctk.CTkButton(window, text="ADD", width=140, height=50, font=("Helvetica", 16, "bold"), fg_color="#588157",hover_color="#436644", cursor="hand2", command=show_add_screen)
-add_button.place(x=150, y=100)
+# the menu is built once the window has shown, so the first paint isn't held up
+def _init_menu():
+    global add_button, edit_button, delete_button, view_button
+    add_button = ctk.CTkButton(window, text="ADD", width=140, height=50, font=FONT_16, **GREEN_BTN, command=show_add_screen)
+    show(add_button, x=150, y=100)
+
+    edit_button = ctk.CTkButton(window, text="EDIT", width=140, height=50, font=FONT_16, **ORANGE_BTN, command=show_edit_screen)
+    show(edit_button, x=400, y=100)
 
-edit_button = ctk.CTkButton(window, text="EDIT", width=140, height=50, font=("Helvetica", 16, "bold"), fg_color="#fca311", hover_color="#c2a800", cursor="hand2", command=show_edit_screen)
-edit_button.place(x=400, y=100)
+    delete_button = ctk.CTkButton(window, text="DELETE", width=140, height=50, font=FONT_16, **RED_BTN, command=show_delete_screen)
+    show(delete_button, x=150, y=190)
 
-delete_button = ctk.CTkButton(window, text="DELETE", width=140, height=50, font=("Helvetica", 16, "bold"), fg_color="#c1121f", hover_color="#960d17", cursor="hand2", command=show_delete_screen)
-delete_button.place(x=150, y=190)
+    view_button = ctk.CTkButton(window, text="VIEW", width=140, height=50, font=FONT_16, **GREY_BTN, command=show_view_screen)
+    show(view_button, x=400, y=190)
 
-view_button = ctk.CTkButton(window, text="VIEW", width=140, height=50, font=("Helvetica", 16, "bold"), fg_color="#778da9", hover_color="#415a77", cursor="hand2", command=show_view_screen)
-view_button.place(x=400, y=190)
+window.after_idle(_init_menu)
 
-back_button = ctk.CTkButton(window, text="BACK", font=("Helvetica", 14, "bold"), width=80, height=30, fg_color="#adb5bd", hover_color="#6c757d", cursor="hand2", command=back_button_event)
+back_button = ctk.CTkButton(window, text="BACK", font=FONT_14, width=80, height=30, **LIGHT_GREY_BTN, command=back_button_event)
 
-window.mainloop()
\ No newline at end of file
+if __name__ == "__main__":
+    window.mainloop()
\ No newline at end of file